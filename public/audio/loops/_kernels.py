@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+THE HOLD - Loop Synthesis Kernels
+
+Numba kernels used by generate-loops.py. They are plain Python functions so
+the generator can either JIT them (with an on-disk cache) or import an
+ahead-of-time build that needs no compilation at all.
+
+Build the AOT extension (loop_kernels) into BUILD_DIR with:
+
+    python _kernels.py
+
+The build also saves a copy of this file as loop_kernels.src; the generator
+only uses the extension while that copy still matches, and falls back to the
+JIT otherwise. The compiled kernels take float32 buffers only.
+
+This module imports without Numba, so the generator can always read the
+constants below.
+"""
+
+import math
+import os
+import shutil
+
+import numpy as np
+
+try:
+    from numba import prange
+except ImportError:  # Only compiling the kernels needs Numba
+    prange = range
+
+# Build output (AOT extension, its source stamp, Numba's JIT cache, loop build
+# keys) lives outside public/ so a local build is never served or shipped
+BUILD_DIR = os.environ.get("LOOPS_BUILD_DIR") or os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir, os.pardir, os.pardir, ".cache", "audio-loops"))
+
+# Samples per block for the phasor rotation; generate-loops.py uses it as
+# ROTATOR_BLOCK so both oscillators share one definition
+BLOCK = 4096
+
+def sine_bank(steps, gains, out):
+    """Add a bank of weighted sine oscillators into out in a single pass.
+
+    Same phasor rotation as the NumPy oscillator: per BLOCK samples each
+    oscillator evaluates sin/cos once for the block start, then every sample
+    is sin(a)cos(b) + cos(a)sin(b) from small per-oscillator offset tables.
+    Phases stay in float64, so nothing drifts across blocks.
+    """
+    n = out.shape[0]
+    num_osc = steps.shape[0]
+    
+    sin_off = np.empty((num_osc, BLOCK))
+    cos_off = np.empty((num_osc, BLOCK))
+    for k in range(num_osc):
+        for j in range(BLOCK):
+            sin_off[k, j] = math.sin(steps[k] * j)
+            cos_off[k, j] = math.cos(steps[k] * j)
+    
+    blocks = (n + BLOCK - 1) // BLOCK
+    for b in prange(blocks):
+        start = b * BLOCK
+        stop = min(start + BLOCK, n)
+        for k in range(num_osc):
+            sin_a = gains[k] * math.sin(steps[k] * start)
+            cos_a = gains[k] * math.cos(steps[k] * start)
+            for i in range(start, stop):
+                j = i - start
+                out[i] += sin_a * cos_off[k, j] + cos_a * sin_off[k, j]
+    
+    return out
+
+def fade_and_normalize(x, fade_samples, headroom):
+    """Edge fades while tracking the peak, then one in-place scale pass."""
+    n = x.shape[0]
+    fade_span = max(fade_samples - 1, 1)
+    peak = 0.0
+    
+    for i in range(n):
+        v = x[i]
+        if i < fade_samples:
+            v *= i / fade_span
+        if i >= n - fade_samples:
+            v *= (n - 1 - i) / fade_span
+        x[i] = v
+    
+        a = abs(v)
+        if a > peak:
+            peak = a
+    
+    if peak > 0:
+        scale = headroom / peak
+        for i in range(n):
+            x[i] *= scale
+    
+    return x
+
+def build():
+    """Compile the kernels into the loop_kernels extension module."""
+    from numba.pycc import CC
+    
+    cc = CC("loop_kernels")
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    cc.output_dir = BUILD_DIR
+    cc.export("sine_bank", "f4[:](f8[:], f4[:], f4[:])")(sine_bank)
+    cc.export("fade_and_normalize", "f4[:](f4[:], i8, f8)")(fade_and_normalize)
+    cc.compile()
+    
+    # Record exactly which source was compiled, to detect stale builds
+    shutil.copyfile(os.path.abspath(__file__),
+                    os.path.join(cc.output_dir, "loop_kernels.src"))
+
+if __name__ == "__main__":
+    build()
@@ -11,12 +11,71 @@ Loops are:
 - 432Hz base frequency
 - Minor key, contemplative
 - Warm, analog character
+
+Synthesis runs in float32 end to end - the output is 16-bit PCM, so double
+precision buys nothing audible. Requires NumPy. If Numba is installed,
+synthesis runs through the fused kernels in _kernels.py - JIT-compiled with
+an on-disk cache, or prebuilt with `python _kernels.py` so no compile happens
+at all. Without Numba it falls back to plain NumPy.
 """
 
 import numpy as np
+import hashlib
+import json
 import wave
 import struct
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+LOOPS_DIR = os.path.dirname(os.path.abspath(__file__))
+if LOOPS_DIR not in sys.path:
+    sys.path.insert(0, LOOPS_DIR)
+
+import _kernels
+
+BUILD_DIR = _kernels.BUILD_DIR
+sys.path.insert(0, BUILD_DIR)
+
+def _aot_build_is_current():
+    """True if loop_kernels was compiled from the current _kernels.py.
+
+    `python _kernels.py` saves a copy of the source it compiled as
+    loop_kernels.src; once the kernels are edited the build is stale.
+    """
+    try:
+        with open(os.path.join(BUILD_DIR, "loop_kernels.src"), "rb") as f:
+            built = f.read()
+        with open(os.path.join(LOOPS_DIR, "_kernels.py"), "rb") as f:
+            return f.read() == built
+    except FileNotFoundError:
+        return False
+
+# Which kernels run: "aot", "jit" or "numpy" (part of every loop's build key)
+try:
+    # Ahead-of-time build of _kernels.py - no JIT compile or cache load
+    if not _aot_build_is_current():
+        raise ImportError("loop_kernels is missing or stale")
+    import loop_kernels
+    _sine_bank_kernel = loop_kernels.sine_bank
+    _fade_and_normalize_kernel = loop_kernels.fade_and_normalize
+    KERNEL_BACKEND = "aot"
+except ImportError:
+    try:
+        import numba
+    except ImportError:  # Numba is optional - fall back to plain NumPy passes
+        _sine_bank_kernel = None
+        _fade_and_normalize_kernel = None
+        KERNEL_BACKEND = "numpy"
+    else:
+        KERNEL_BACKEND = "jit"
+        # Keep the on-disk JIT cache out of public/ (NUMBA_CACHE_DIR still wins)
+        if not numba.config.CACHE_DIR:
+            numba.config.CACHE_DIR = os.path.join(BUILD_DIR, "numba")
+        _sine_bank_kernel = numba.njit(
+            cache=True, parallel=True, fastmath=True)(_kernels.sine_bank)
+        _fade_and_normalize_kernel = numba.njit(
+            cache=True, fastmath=True)(_kernels.fade_and_normalize)
 
 # Audio settings
 SAMPLE_RATE = 48000
@@ -27,69 +86,235 @@ MAX_AMP = 32767
 BASE_FREQ = 432  # Hz - contemplative tuning
 MINOR_RATIOS = [1, 1.2, 1.5, 2, 2.4, 3]  # Minor-like harmonic series
 
+# Samples per block for the phasor-rotation oscillator (shared with the kernels)
+ROTATOR_BLOCK = _kernels.BLOCK
+
+# Shared generator for all random choices (PCG64); pass seed= for repeatable loops
+RNG = np.random.default_rng()
+
+# Seed used by main() so asset builds are reproducible and can be cached
+SEED = 432
+
+# Files whose contents feed the build key of every generated loop, including
+# the compiled extension when that is what runs
+GENERATOR_SOURCES = [
+    os.path.abspath(__file__),
+    os.path.join(LOOPS_DIR, "_kernels.py"),
+]
+if KERNEL_BACKEND == "aot":
+    GENERATOR_SOURCES.append(loop_kernels.__file__)
+
+# Build key of each generated WAV, kept with the other build output
+MANIFEST_PATH = os.path.join(BUILD_DIR, "loops-manifest.json")
+
+def _rng(seed=None):
+    """Return the module generator, or a fresh one when a seed is given."""
+    return RNG if seed is None else np.random.default_rng(seed)
+
+def n_samples(duration, sample_rate=SAMPLE_RATE):
+    """Sample count for a duration; each loop sizes all its buffers from it."""
+    return int(round(sample_rate * duration))
+
+def time_vector(n, sample_rate=SAMPLE_RATE):
+    """Build the sample-time array shared by every oscillator in a loop."""
+    return np.arange(n, dtype=np.float32) / np.float32(sample_rate)
+
+def _sine_from_t(freq, t):
+    """Pure sine wave over a precomputed time vector."""
+    return np.sin(t.dtype.type(2 * np.pi * freq) * t)
+
+def _sine_rotator(freq, n, sample_rate=SAMPLE_RATE):
+    """Pure sine wave of n samples built by phasor rotation.
+
+    Uses sin(a + b) = sin(a)cos(b) + cos(a)sin(b), with a the start phase of
+    each ROTATOR_BLOCK-sample block and b the offset within it. Only the two
+    small phase tables go through sin/cos (in float64); every sample costs two
+    multiplies and an add. Each block starts from an exact phase, so no
+    rounding error builds up over the loop.
+
+    `freq` may also be an array of K frequencies, giving a (K, n) bank.
+    """
+    freq = np.asarray(freq, dtype=np.float64)[..., None, None]
+    step = 2 * np.pi * freq / sample_rate
+    blocks = -(-n // ROTATOR_BLOCK)
+    
+    block_phase = step * (ROTATOR_BLOCK * np.arange(blocks))[:, None]
+    offset_phase = step * np.arange(ROTATOR_BLOCK)
+    sin_a = np.sin(block_phase).astype(np.float32)
+    cos_a = np.cos(block_phase).astype(np.float32)
+    sin_b = np.sin(offset_phase).astype(np.float32)
+    cos_b = np.cos(offset_phase).astype(np.float32)
+    
+    wave = sin_a * cos_b
+    wave += cos_a * sin_b
+    return wave.reshape(wave.shape[:-2] + (-1,))[..., :n]
+
+def _triangle_from_t(freq, t):
+    """Triangle wave over a precomputed time vector.
+
+    Wraps the phase instead of taking arcsin(sin(...)): with p = f*t + 1/4,
+    the wave is 1 - 4|frac(p) - 1/2| - same shape and phase, no
+    transcendentals, and every step runs in place on one buffer.
+    """
+    phase = t * t.dtype.type(freq)
+    phase += 0.25
+    phase -= np.floor(phase)
+    phase -= 0.5
+    np.abs(phase, out=phase)
+    phase *= -4
+    phase += 1
+    return phase
+
 def generate_sine_wave(freq, duration, sample_rate=SAMPLE_RATE):
     """Generate a pure sine wave."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    return np.sin(2 * np.pi * freq * t)
+    n = n_samples(duration, sample_rate)
+    return _sine_from_t(freq, time_vector(n, sample_rate))
 
 def generate_triangle_wave(freq, duration, sample_rate=SAMPLE_RATE):
     """Generate a triangle wave."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    return 2 * np.arcsin(np.sin(2 * np.pi * freq * t)) / np.pi
+    n = n_samples(duration, sample_rate)
+    return _triangle_from_t(freq, time_vector(n, sample_rate))
+
+# Unit ramps keyed by (length, dtype); fade lengths recur across the loops
+_RAMPS = {}
+
+def _ramp(n, dtype):
+    """Read-only 0 -> 1 ramp of n samples, same values as np.linspace(0, 1, n).
+
+    Reverse it with [::-1] for the matching 1 -> 0 ramp (a view, no copy).
+    """
+    key = (n, np.dtype(dtype))
+    ramp = _RAMPS.get(key)
+    if ramp is None:
+        ramp = np.arange(n, dtype=dtype) * key[1].type(1.0 / max(n - 1, 1))
+        ramp.setflags(write=False)
+        _RAMPS[key] = ramp
+    return ramp
 
 def apply_fade(waveform, fade_duration=0.1, sample_rate=SAMPLE_RATE):
     """Apply fade in/out for seamless looping."""
-    fade_samples = int(fade_duration * sample_rate)
+    # A fade longer than the loop spans the whole buffer
+    fade_samples = min(n_samples(fade_duration, sample_rate), len(waveform))
+    
+    # waveform[-0:] would be the whole buffer, so a zero fade is a no-op
+    if fade_samples <= 0:
+        return waveform
+    
+    fade_in = _ramp(fade_samples, waveform.dtype)
     
     # Fade in
-    fade_in = np.linspace(0, 1, fade_samples)
     waveform[:fade_samples] *= fade_in
     
     # Fade out
-    fade_out = np.linspace(1, 0, fade_samples)
-    waveform[-fade_samples:] *= fade_out
+    waveform[-fade_samples:] *= fade_in[::-1]
     
     return waveform
 
 def apply_envelope(waveform, attack=0.5, release=0.5, sample_rate=SAMPLE_RATE):
-    """Apply ADSR-like envelope."""
-    attack_samples = int(attack * sample_rate)
-    release_samples = int(release * sample_rate)
-    
-    envelope = np.ones_like(waveform)
+    """Apply ADSR-like envelope.
+
+    Works in place, like apply_fade: only the attack and release regions are
+    touched, since the sustain gain is 1.
+    """
+    attack_samples = min(n_samples(attack, sample_rate), len(waveform))
+    release_samples = min(n_samples(release, sample_rate), len(waveform))
     
     # Attack
     if attack_samples > 0:
-        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+        waveform[:attack_samples] *= _ramp(attack_samples, waveform.dtype)
     
     # Release
     if release_samples > 0:
-        envelope[-release_samples:] = np.linspace(1, 0, release_samples)
+        waveform[-release_samples:] *= _ramp(release_samples,
+                                             waveform.dtype)[::-1]
     
-    return waveform * envelope
+    return waveform
 
 def mix_waveforms(waveforms, gains=None):
-    """Mix multiple waveforms with optional gains."""
-    if gains is None:
-        gains = [1.0 / len(waveforms)] * len(waveforms)
+    """Mix multiple waveforms with optional gains.
+
+    Accepts a list of equal-length waves or a preallocated (K, N) array; the
+    weighted sum is a single matrix-vector product over all K waves.
+    """
+    if isinstance(waveforms, np.ndarray) and waveforms.ndim == 2:
+        stacked = waveforms
+    else:
+        stacked = np.stack(waveforms)
     
-    mixed = np.zeros_like(waveforms[0])
-    for wave, gain in zip(waveforms, gains):
-        mixed += wave * gain
+    if gains is None:
+        gains = [1.0 / len(stacked)] * len(stacked)
     
-    return mixed
+    return np.asarray(gains, dtype=stacked.dtype) @ stacked
 
 def normalize_audio(waveform, headroom=0.9):
     """Normalize audio to prevent clipping."""
     peak = np.max(np.abs(waveform))
     if peak > 0:
-        waveform = waveform / peak * headroom
+        waveform = waveform * waveform.dtype.type(headroom / peak)
     return waveform
 
+def fade_and_normalize(waveform, fade_duration=0.1, headroom=0.9,
+                       sample_rate=SAMPLE_RATE):
+    """Apply loop fades and normalize, in place.
+
+    Same result as apply_fade followed by normalize_audio: the peak is still
+    measured after fading, but no intermediate buffers are allocated. The
+    compiled kernel handles float32; other dtypes take the NumPy path.
+    """
+    # Clamped like apply_fade, so the kernel sees the same fade length
+    fade_samples = min(max(n_samples(fade_duration, sample_rate), 0),
+                       len(waveform))
+    
+    if _fade_and_normalize_kernel is not None and waveform.dtype == np.float32:
+        return _fade_and_normalize_kernel(waveform, fade_samples, headroom)
+    
+    waveform = apply_fade(waveform, fade_duration, sample_rate)
+    # Peak without materializing np.abs(waveform)
+    peak = max(waveform.max(), -waveform.min())
+    if peak > 0:
+        waveform *= waveform.dtype.type(headroom / peak)
+    return waveform
+
+def oscillator_bank(freqs, gains, out):
+    """Add a bank of sine oscillators, weighted by gains, into out.
+
+    With Numba and a float32 out this is one compiled pass over out with
+    every oscillator summed per sample; otherwise the bank is rotated out and
+    mixed in NumPy.
+    """
+    freqs = np.asarray(freqs, dtype=np.float64)
+    gains = np.asarray(gains, dtype=out.dtype)
+    
+    if _sine_bank_kernel is not None and out.dtype == np.float32:
+        steps = 2 * np.pi * freqs / SAMPLE_RATE
+        return _sine_bank_kernel(steps, gains, out)
+    
+    out += mix_waveforms(_sine_rotator(freqs, len(out)), gains)
+    return out
+
+def synthesize(freqs, gains, n, fade_duration=0.1, headroom=0.9):
+    """Mix a bank of sine oscillators, fade the loop edges and scale to headroom.
+
+    Gains are pre-scaled so the mix never exceeds headroom; when the fades
+    cover the whole loop the peak is measured instead, as they can pull it far
+    below that bound.
+    """
+    gains = np.asarray(gains, dtype=np.float64)
+    
+    if 2 * n_samples(fade_duration) >= n:
+        mixed = oscillator_bank(freqs, gains, np.zeros(n, dtype=np.float32))
+        return fade_and_normalize(mixed, fade_duration, headroom)
+    
+    gains = gains * (headroom / np.sum(np.abs(gains)))
+    mixed = oscillator_bank(freqs, gains, np.zeros(n, dtype=np.float32))
+    return apply_fade(mixed, fade_duration=fade_duration)
+
 def save_wav(waveform, filename, sample_rate=SAMPLE_RATE):
     """Save waveform as WAV file."""
-    # Convert to 16-bit integers
-    waveform_int = (waveform * MAX_AMP).astype(np.int16)
+    # Convert to 16-bit integers (straight from float32, no float64 detour),
+    # scaling and truncating into a single int16 buffer
+    waveform_int = np.empty(waveform.shape, dtype=np.int16)
+    np.multiply(waveform, MAX_AMP, out=waveform_int, casting='unsafe')
     
     # Ensure directory exists
     os.makedirs(os.path.dirname(filename), exist_ok=True)
@@ -99,77 +324,62 @@ def save_wav(waveform, filename, sample_rate=SAMPLE_RATE):
         wav_file.setnchannels(1)  # Mono
         wav_file.setsampwidth(2)  # 16-bit
         wav_file.setframerate(sample_rate)
-        wav_file.writeframes(waveform_int.tobytes())
+        # The array is passed as a buffer, skipping a tobytes() copy
+        wav_file.writeframes(waveform_int)
     
     print(f"Saved: {filename}")
 
-def generate_drone_loop(duration=6.0):
+def generate_drone_loop(duration=6.0, seed=None):
     """Generate a contemplative drone loop."""
     # Base frequency (octave below 432)
     base = BASE_FREQ / 2
+    n = n_samples(duration)
     
     # Create harmonics
-    harmonics = []
+    ratios = MINOR_RATIOS[:4]
+    freqs = []
     gains = []
     
-    for i, ratio in enumerate(MINOR_RATIOS[:4]):
+    # Slight detune for richness, ±1 Hz per harmonic
+    detunes = _rng(seed).uniform(-1.0, 1.0, size=len(ratios))
+    
+    for i, (ratio, detune) in enumerate(zip(ratios, detunes)):
         freq = base * ratio
-        # Slight detune for richness
-        detune = (np.random.random() - 0.5) * 2  # ±1 Hz
-        
-        wave = generate_sine_wave(freq + detune, duration)
         
         # Higher harmonics are quieter
         gain = 1.0 / (i + 1)
         
-        harmonics.append(wave)
+        freqs.append(freq + detune)
         gains.append(gain)
     
-    # Mix harmonics
-    mixed = mix_waveforms(harmonics, gains)
-    
-    # Apply subtle envelope for seamless loop
-    mixed = apply_fade(mixed, fade_duration=0.5)
-    
-    # Normalize
-    mixed = normalize_audio(mixed, headroom=0.7)
-    
-    return mixed
+    # Mix harmonics scaled to headroom, apply subtle envelope for seamless loop
+    return synthesize(freqs, gains, n, fade_duration=0.5, headroom=0.7)
 
-def generate_texture_loop(duration=4.0):
+def generate_texture_loop(duration=4.0, seed=None):
     """Generate a granular-style texture loop."""
     # Multiple overlapping tones
     num_tones = 5
-    tones = []
+    n = n_samples(duration)
+    rng = _rng(seed)
     
-    for _ in range(num_tones):
-        # Random frequency in range
-        freq = np.random.uniform(200, 800)
-        
-        # Random duration for each tone
-        tone_duration = np.random.uniform(1.0, 3.0)
-        tone_start = np.random.uniform(0, duration - tone_duration)
-        
-        # Generate tone
-        tone = generate_sine_wave(freq, duration)
-        
-        # Apply envelope to create grain-like effect
-        tone = apply_envelope(tone, attack=0.3, release=0.3)
-        
-        # Random pan position (simulated by amplitude)
-        pan = np.random.uniform(0.5, 1.0)
-        tone *= pan
-        
-        tones.append(tone)
+    # Random frequency in range
+    freqs = rng.uniform(200, 800, size=num_tones)
+    
+    # Random pan position (simulated by amplitude)
+    pans = rng.uniform(0.5, 1.0, size=num_tones)
+    
+    # Generate all tones as one (num_tones, n) bank
+    tones = _sine_rotator(freqs, n)
     
-    # Mix tones
-    mixed = mix_waveforms(tones)
+    # Mix tones, folding each pan into its mix gain
+    mixed = mix_waveforms(tones, pans / num_tones)
     
-    # Apply fade for seamless loop
-    mixed = apply_fade(mixed, fade_duration=0.3)
+    # Apply envelope to create grain-like effect - every tone shares the same
+    # envelope, so shaping the mix is identical to shaping each tone
+    mixed = apply_envelope(mixed, attack=0.3, release=0.3)
     
-    # Normalize
-    mixed = normalize_audio(mixed, headroom=0.5)
+    # Apply fade for seamless loop and normalize
+    mixed = fade_and_normalize(mixed, fade_duration=0.3, headroom=0.5)
     
     return mixed
 
@@ -180,35 +390,33 @@ def generate_breath_loop(duration=11.0):
     base_freq = 216  # Subtle low presence
     
     # Create the breath modulation
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration), False)
+    n = n_samples(duration)
     
     # Inhale (0-4s): rising
     # Exhale (4-10s): falling  
     # Pause (10-11s): silence
     
-    breath_shape = np.zeros_like(t)
+    # Section lengths follow from the sample rate, so the shape is built from
+    # contiguous segments rather than masked writes
+    n_inhale = min(n_samples(4), n)
+    n_exhale = min(n_samples(6), n - n_inhale)
+    n_pause = n - n_inhale - n_exhale
     
-    # Inhale phase
-    inhale_mask = t < 4
-    breath_shape[inhale_mask] = np.linspace(0, 0.5, np.sum(inhale_mask))
-    
-    # Exhale phase
-    exhale_mask = (t >= 4) & (t < 10)
-    breath_shape[exhale_mask] = np.linspace(0.5, 0, np.sum(exhale_mask))
-    
-    # Pause phase - already zeros
+    breath_shape = np.concatenate([
+        np.linspace(0, 0.5, n_inhale, dtype=np.float32),
+        np.linspace(0.5, 0, n_exhale, dtype=np.float32),
+        np.zeros(n_pause, dtype=np.float32),
+    ])
     
     # Generate carrier wave
-    carrier = generate_sine_wave(base_freq, duration)
+    carrier = _sine_rotator(base_freq, n)
     
     # Modulate with breath shape
     modulated = carrier * breath_shape
     
-    # Apply fade for seamless loop (breath loops need careful fading)
-    modulated = apply_fade(modulated, fade_duration=1.0)
-    
-    # Normalize
-    modulated = normalize_audio(modulated, headroom=0.4)
+    # Apply fade for seamless loop (breath loops need careful fading) and
+    # normalize
+    modulated = fade_and_normalize(modulated, fade_duration=1.0, headroom=0.4)
     
     return modulated
 
@@ -216,59 +424,127 @@ def generate_pad_loop(duration=8.0):
     """Generate a warm pad loop."""
     # Richer pad with triangle waves
     base = BASE_FREQ / 4  # Two octaves down
-    
-    waves = []
-    gains = []
+    n = n_samples(duration)
+    t = time_vector(n)
     
     # Fundamental
-    waves.append(generate_triangle_wave(base, duration))
-    gains.append(0.5)
+    mixed = _triangle_from_t(base, t)
+    mixed *= mixed.dtype.type(0.5)
     
-    # Octave
-    waves.append(generate_sine_wave(base * 2, duration))
-    gains.append(0.3)
+    # Octave and fifth, mixed straight onto the fundamental
+    oscillator_bank([base * 2, base * 1.5], [0.3, 0.2], mixed)
     
-    # Fifth
-    waves.append(generate_sine_wave(base * 1.5, duration))
-    gains.append(0.2)
-    
-    # Mix
-    mixed = mix_waveforms(waves, gains)
-    
-    # Apply long fade for very smooth loop
-    mixed = apply_fade(mixed, fade_duration=1.5)
-    
-    # Normalize
-    mixed = normalize_audio(mixed, headroom=0.6)
+    # Apply long fade for very smooth loop and normalize
+    mixed = fade_and_normalize(mixed, fade_duration=1.5, headroom=0.6)
     
     return mixed
 
+def _build_key(label, params):
+    """Digest of a loop's parameters, kernel backend and generator source.
+
+    Hashing the source files as well means any change to the synthesis code
+    invalidates every cached loop, not just changes to the parameters. The
+    backends differ slightly in their output, so switching between them (or
+    rebuilding the AOT extension) invalidates them too.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    config = {
+        "loop": label,
+        "sample_rate": SAMPLE_RATE,
+        "backend": KERNEL_BACKEND,
+        **params,
+    }
+    digest.update(json.dumps(config, sort_keys=True).encode())
+    
+    for source in GENERATOR_SOURCES:
+        if os.path.exists(source):
+            with open(source, "rb") as f:
+                digest.update(f.read())
+    
+    return digest.hexdigest()
+
+def _load_manifest():
+    """Build keys of the loops generated so far, by WAV filename."""
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _save_manifest(manifest):
+    """Write the build-key manifest to BUILD_DIR."""
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def _generate_loops(tasks, workers):
+    """Yield each task's waveform in order.
+
+    The loops are independent and CPU-bound, so with more than one worker they
+    are generated in parallel processes; results still come back in task
+    order so the main process can save and report them without interleaving.
+    """
+    if workers <= 1:
+        for _, generator, params, _ in tasks:
+            yield generator(**params)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(generator, **params)
+            for _, generator, params, _ in tasks
+        ]
+        for future in futures:
+            yield future.result()
+
 def main():
-    """Generate all loop assets."""
+    """Generate all loop assets.
+
+    Each loop is skipped when its WAV is already up to date: the manifest in
+    BUILD_DIR records the build key each WAV was generated from. Delete the
+    manifest (or the loop's entry) to force a rebuild.
+    """
     output_dir = os.path.dirname(os.path.abspath(__file__))
     
     print("THE HOLD - Loop Asset Generator")
     print("=" * 40)
     
-    # Generate drone loop
-    print("\nGenerating drone loop...")
-    drone = generate_drone_loop(duration=6.0)
-    save_wav(drone, os.path.join(output_dir, "drone-base.wav"))
-    
-    # Generate texture loop
-    print("\nGenerating texture loop...")
-    texture = generate_texture_loop(duration=4.0)
-    save_wav(texture, os.path.join(output_dir, "texture-grains.wav"))
-    
-    # Generate breath loop
-    print("\nGenerating breath loop...")
-    breath = generate_breath_loop(duration=11.0)
-    save_wav(breath, os.path.join(output_dir, "breath-cycle.wav"))
-    
-    # Generate pad loop
-    print("\nGenerating pad loop...")
-    pad = generate_pad_loop(duration=8.0)
-    save_wav(pad, os.path.join(output_dir, "pad-warm.wav"))
+    # (label, generator, params, filename)
+    tasks = [
+        ("drone", generate_drone_loop, {"duration": 6.0, "seed": SEED},
+         "drone-base.wav"),
+        ("texture", generate_texture_loop, {"duration": 4.0, "seed": SEED},
+         "texture-grains.wav"),
+        ("breath", generate_breath_loop, {"duration": 11.0},
+         "breath-cycle.wav"),
+        ("pad", generate_pad_loop, {"duration": 8.0}, "pad-warm.wav"),
+    ]
+    
+    manifest = _load_manifest()
+    pending = []
+    for task in tasks:
+        label, _, params, filename = task
+        path = os.path.join(output_dir, filename)
+        key = _build_key(label, params)
+        
+        if os.path.exists(path) and manifest.get(filename) == key:
+            print(f"\nSkipping {label} loop (up to date)")
+        else:
+            pending.append((task, path, key))
+    
+    # On a single core a process pool is pure overhead
+    workers = min(len(pending), os.cpu_count() or 1)
+    waveforms = _generate_loops([task for task, _, _ in pending], workers)
+    
+    for task, path, key in pending:
+        print(f"\nGenerating {task[0]} loop...")
+        save_wav(next(waveforms), path)
+        
+        # Record each loop as soon as it is saved, so an interrupted run
+        # keeps the loops it finished
+        manifest[task[3]] = key
+        _save_manifest(manifest)
     
     print("\n" + "=" * 40)
     print("Loop generation complete!")